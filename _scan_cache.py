@@ -0,0 +1,54 @@
+"""sqlite persistence for the (path, mtime_ns, min_size) -> size scan cache.
+
+The app keeps the cache as a plain dict; this module only loads it at
+startup and writes it back in one executemany batch, so huge trees don't
+pay per-entry write cost. WAL mode keeps the single write cheap and
+crash-safe. Every failure is swallowed — the cache is an optimization,
+never a requirement.
+"""
+
+import os
+import sqlite3
+
+_DB_DIR = os.path.join(os.path.expanduser("~"), ".cache")
+DB_PATH = os.path.join(_DB_DIR, "file-size-visualizer.db")
+
+def _connect():
+    os.makedirs(_DB_DIR, exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("DROP TABLE IF EXISTS dir_sizes")  # pre-threshold schema
+    conn.execute("CREATE TABLE IF NOT EXISTS dir_sizes_v2 ("
+                 "path TEXT, min_size INTEGER, mtime_ns INTEGER, size INTEGER, "
+                 "PRIMARY KEY (path, min_size))")
+    return conn
+
+def load() -> dict:
+    """Return {(path, mtime_ns, min_size): size} from the on-disk cache."""
+    try:
+        conn = _connect()
+        try:
+            rows = conn.execute(
+                "SELECT path, mtime_ns, min_size, size FROM dir_sizes_v2").fetchall()
+        finally:
+            conn.close()
+        return {(p, m, ms): s for p, m, ms, s in rows}
+    except Exception:
+        return {}
+
+def save(cache: dict):
+    """Write the mapping back in one batch; one row per key, newest wins."""
+    try:
+        conn = _connect()
+        try:
+            conn.execute("BEGIN")
+            conn.executemany(
+                "INSERT OR REPLACE INTO dir_sizes_v2 (path, mtime_ns, min_size, size) "
+                "VALUES (?, ?, ?, ?)",
+                [(p, m, ms, s) for (p, m, ms), s in cache.items()])
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+    except Exception:
+        pass
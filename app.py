@@ -1,112 +1,289 @@
+import csv
 import os
+import subprocess
 import threading
 import queue
+import functools
 import math
+import operator
+import time
+import stat as stat_module
+from collections import deque
 from dataclasses import dataclass
 from typing import List, Optional, Callable, Dict
 import ctypes
+import atexit
 import concurrent.futures
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, font
 
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+from _linux_statx import statx_size
+import _linux_statx
+import _scan_cache
 
+import numpy as np
+
+# matplotlib is deliberately NOT imported at module level: its import plus
+# Tk-backend canvas construction dominate cold start, and neither is needed
+# until the first pie draw. See App._ensure_canvas.
+
+@functools.lru_cache(maxsize=1)
+def _tab20_table():
+    # Precomputed RGBA table; indexing it per label beats re-dispatching the
+    # colormap on every redraw.
+    from matplotlib import cm
+    return cm.tab20(np.arange(20) / 20.0)
+
+# Shared long-lived pool: scans are I/O-bound, so oversubscribe the cores.
+# Reused across root scans and nested expansions to avoid thread spin-up cost.
+# FSV_SCAN_THREADS overrides the sizing for unusual setups (e.g. NFS mounts
+# that benefit from more outstanding requests).
 try:
-    import humanize
-    HUMANIZE = True
-except Exception:
-    HUMANIZE = False
+    _SCAN_THREADS = int(os.environ.get("FSV_SCAN_THREADS", "") or 0)
+except ValueError:
+    _SCAN_THREADS = 0
+if _SCAN_THREADS <= 0:
+    _SCAN_THREADS = min(32, (os.cpu_count() or 4) * 4)
+_SCAN_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=_SCAN_THREADS)
+atexit.register(_SCAN_POOL.shutdown, wait=False)
 
 @dataclass
 class ItemSize:
+    # Manual __slots__ (not dataclass(slots=True)) to keep the 3.9 floor;
+    # drops the per-instance __dict__, which adds up on 100k-item scans.
+    __slots__ = ("label", "path", "size", "is_dir")
     label: str
     path: str
     size: int
     is_dir: bool
 
+UNITS = ("B", "KB", "MB", "GB", "TB")
+
+@functools.lru_cache(maxsize=65536)
 def human_size(n: int) -> str:
-    if HUMANIZE:
-        return humanize.naturalsize(n, binary=True)
-    units = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    v = float(n)
-    while v >= 1024 and i < len(units) - 1:
-        v /= 1024
-        i += 1
-    return f"{v:.2f} {units[i]}"
+    # bit_length picks the unit in one step; called once per tree row, so
+    # the loop-free form matters on big listings.
+    if n <= 0:
+        return "0.00 B"
+    i = min((n.bit_length() - 1) // 10, len(UNITS) - 1)
+    return f"{n / (1 << (i * 10)):.2f} {UNITS[i]}"
+
+def human_size_array(sizes) -> List[str]:
+    """Vectorized human_size for bulk formatting (tree populate, export).
+
+    Unit selection and scaling run as single NumPy passes; only the final
+    f-string loop stays in Python. Matches human_size's output exactly.
+    """
+    arr = np.asarray(sizes, dtype=np.float64)
+    if arr.size == 0:
+        return []
+    idx = np.minimum((np.log2(np.maximum(arr, 1)) // 10).astype(np.int64), len(UNITS) - 1)
+    scaled = arr / np.power(1024.0, idx)
+    units = UNITS
+    return [f"{v:.2f} {units[i]}" for v, i in zip(scaled.tolist(), idx.tolist())]
+
+# Memoized subtree totals keyed by (path, mtime_ns, min_size), persisted
+# across runs via _scan_cache (sqlite). A directory's mtime only changes when
+# direct children are added/removed, so this is best-effort: right for repeat
+# scans of mostly-static trees, and a fresh mtime invalidates the entry.
+# Walks with a custom file_filter callable are never cached.
+_SIZE_CACHE: Dict[tuple, int] = _scan_cache.load()
+_SIZE_CACHE_LOCK = threading.Lock()
+
+def _save_size_cache():
+    with _SIZE_CACHE_LOCK:
+        snapshot = dict(_SIZE_CACHE)
+    _scan_cache.save(snapshot)
+
+atexit.register(_save_size_cache)
+
+# Cap on helper tasks in flight across all concurrent scans, so a burst of
+# folder expansions can't flood the shared pool's queue (or fd table).
+_HELPER_SLOTS = threading.BoundedSemaphore(64)
+_HELPERS_PER_SCAN = 3
 
 def compute_dir_size(path: str,
                      file_filter: Optional[Callable[[str, int], bool]] = None,
                      progress_cb: Optional[Callable[[str], None]] = None,
-                     cancel_cb: Optional[Callable[[], bool]] = None) -> int:
-    total = 0
-    try:
-        with os.scandir(path) as it:
-            for entry in it:
-                if cancel_cb and cancel_cb():
-                    return total
-                try:
-                    if entry.is_symlink():
-                        continue
-                    if entry.is_dir(follow_symlinks=False):
-                        total += compute_dir_size(entry.path, file_filter, progress_cb, cancel_cb)
-                    elif entry.is_file(follow_symlinks=False):
-                        size = entry.stat(follow_symlinks=False).st_size
-                        if file_filter is None or file_filter(entry.path, size):
-                            total += size
-                except (PermissionError, OSError):
-                    pass
-    except (PermissionError, OSError):
-        pass
-    if progress_cb: 
-        try: progress_cb(path)
-        except: pass
+                     cancel_cb: Optional[Callable[[], bool]] = None,
+                     fast_sizes: bool = False,
+                     min_size: int = 0) -> int:
+    # Thresholded walks are cacheable too — the threshold just becomes part
+    # of the key, so toggling a filter off and back on reuses both totals.
+    # Only arbitrary callables defeat the cache.
+    cache_key = None
+    if file_filter is None:
+        try:
+            cache_key = (path, os.stat(path).st_mtime_ns, min_size)
+        except OSError:
+            pass
+        if cache_key is not None:
+            with _SIZE_CACHE_LOCK:
+                cached = _SIZE_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
+    # Parallel walk over a shared deque of directories: the calling thread
+    # drains work itself while a few pool helpers steal from the same deque,
+    # so wide subtrees at any depth get multiple threads. Helpers never block
+    # on each other, and the scan completes even if no helper ever runs.
+    work = deque([path])
+    cond = threading.Condition()
+    totals = [0]
+    active = [0]
+    use_statx = fast_sizes and _linux_statx.available()
+
+    def _drain() -> int:
+        # Locals for everything touched per entry; LOAD_FAST beats the
+        # attribute lookups in a loop that runs once per filesystem object.
+        subtotal = 0
+        pop = work.popleft
+        push = work.append
+        scandir = os.scandir
+        S_ISREG = stat_module.S_ISREG
+        S_ISDIR = stat_module.S_ISDIR
+        while True:
+            try:
+                p = pop()
+            except IndexError:
+                break
+            if cancel_cb and cancel_cb():
+                break
+            try:
+                with scandir(p) as it:
+                    for entry in it:
+                        try:
+                            if use_statx:
+                                # d_type checks are free; statx supplies sizes.
+                                if entry.is_symlink():
+                                    continue
+                                if entry.is_dir(follow_symlinks=False):
+                                    push(entry.path)
+                                elif entry.is_file(follow_symlinks=False):
+                                    size = statx_size(entry.path)
+                                    if size is None:
+                                        size = entry.stat(follow_symlinks=False).st_size
+                                    if size >= min_size and (file_filter is None or file_filter(entry.path, size)):
+                                        subtotal += size
+                            else:
+                                # One lstat per entry; mode bits classify it.
+                                # Symlinks fall through (neither REG nor DIR).
+                                st = entry.stat(follow_symlinks=False)
+                                mode = st.st_mode
+                                if S_ISREG(mode):
+                                    size = st.st_size
+                                    if size >= min_size and (file_filter is None or file_filter(entry.path, size)):
+                                        subtotal += size
+                                elif S_ISDIR(mode):
+                                    push(entry.path)
+                        except (PermissionError, OSError):
+                            pass
+            except (PermissionError, OSError):
+                pass
+            # No try/except here: the callback is our own throttled closure
+            # (a monotonic-clock check and an occasional queue put), and the
+            # per-directory exception frame isn't free on deep trees.
+            if progress_cb:
+                progress_cb(p)
+        return subtotal
+
+    def _helper():
+        try:
+            subtotal = _drain()
+        except Exception:
+            subtotal = 0
+        _HELPER_SLOTS.release()
+        with cond:
+            totals[0] += subtotal
+            active[0] -= 1
+            cond.notify_all()
+
+    helpers = []
+    for _ in range(_HELPERS_PER_SCAN):
+        if _HELPER_SLOTS.acquire(blocking=False):
+            with cond:
+                active[0] += 1
+            helpers.append(_SCAN_POOL.submit(_helper))
+
+    while True:
+        subtotal = _drain()
+        with cond:
+            totals[0] += subtotal
+        if not work or (cancel_cb and cancel_cb()):
+            # Revoke helpers that never got scheduled; they may be queued
+            # behind other scans on the shared pool and we must not wait
+            # on them (that's how pool-wide deadlocks happen).
+            still_pending = []
+            for f in helpers:
+                if f.cancel():
+                    _HELPER_SLOTS.release()
+                    with cond:
+                        active[0] -= 1
+                elif not f.done():
+                    still_pending.append(f)
+            helpers = still_pending
+        with cond:
+            if active[0] == 0 and (not work or (cancel_cb and cancel_cb())):
+                break
+            cond.wait(0.05)
+
+    total = totals[0]
+    # Don't cache partial totals from a cancelled walk.
+    if cache_key is not None and not (cancel_cb and cancel_cb()):
+        with _SIZE_CACHE_LOCK:
+            _SIZE_CACHE[cache_key] = total
     return total
 
 def list_items_parallel(folder: str,
                         file_filter: Optional[Callable[[str, int], bool]] = None,
                         progress_cb: Optional[Callable[[str], None]] = None,
-                        cancel_cb: Optional[Callable[[], bool]] = None) -> List[ItemSize]:
+                        cancel_cb: Optional[Callable[[], bool]] = None,
+                        fast_sizes: bool = False,
+                        min_size: int = 0,
+                        on_item: Optional[Callable[[ItemSize], None]] = None) -> List[ItemSize]:
     items: List[ItemSize] = []
     dirs_to_scan = []
-    
+
+    def _emit(item: ItemSize):
+        items.append(item)
+        if on_item:
+            on_item(item)
+
     try:
         with os.scandir(folder) as it:
             for entry in it:
-                if entry.is_symlink():
+                # One lstat per entry; mode bits tell us dir/file/symlink in one go.
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except (PermissionError, OSError):
                     continue
-                if entry.is_dir(follow_symlinks=False):
+                mode = st.st_mode
+                if stat_module.S_ISDIR(mode):
                     dirs_to_scan.append(entry)
-                elif entry.is_file(follow_symlinks=False):
-                    try:
-                        size = entry.stat(follow_symlinks=False).st_size
-                        if file_filter is None or file_filter(entry.path, size):
-                            items.append(ItemSize(label=entry.name, path=entry.path, size=size, is_dir=False))
-                    except:
-                        pass
+                elif stat_module.S_ISREG(mode):
+                    if st.st_size >= min_size and (file_filter is None or file_filter(entry.path, st.st_size)):
+                        _emit(ItemSize(label=entry.name, path=entry.path, size=st.st_size, is_dir=False))
     except Exception:
         return []
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
-        future_to_entry = {}
-        for entry in dirs_to_scan:
-            if cancel_cb and cancel_cb():
-                break
-            future = executor.submit(compute_dir_size, entry.path, file_filter, progress_cb, cancel_cb)
-            future_to_entry[future] = entry
-
-        for future in concurrent.futures.as_completed(future_to_entry):
-            if cancel_cb and cancel_cb():
-                break
-            entry = future_to_entry[future]
-            try:
-                size = future.result()
-                if file_filter is None or size > 0: 
-                    items.append(ItemSize(label=entry.name, path=entry.path, size=size, is_dir=True))
-            except Exception:
-                items.append(ItemSize(label=entry.name, path=entry.path, size=0, is_dir=True))
+    future_to_entry = {}
+    for entry in dirs_to_scan:
+        if cancel_cb and cancel_cb():
+            break
+        future = _SCAN_POOL.submit(compute_dir_size, entry.path, file_filter, progress_cb, cancel_cb, fast_sizes, min_size)
+        future_to_entry[future] = entry
+
+    for future in concurrent.futures.as_completed(future_to_entry):
+        if cancel_cb and cancel_cb():
+            break
+        entry = future_to_entry[future]
+        try:
+            size = future.result()
+            if file_filter is None or size > 0:
+                _emit(ItemSize(label=entry.name, path=entry.path, size=size, is_dir=True))
+        except Exception:
+            _emit(ItemSize(label=entry.name, path=entry.path, size=0, is_dir=True))
 
     return items
 
@@ -131,16 +308,23 @@ class App(tk.Tk):
         self.selected_folder: Optional[str] = None
         self.scan_thread: Optional[threading.Thread] = None
         self.scan_queue: queue.Queue = queue.Queue()
+        self._export_queue: queue.Queue = queue.Queue()
         self._cancel_flag = False
         
         self._root_items: List[ItemSize] = [] 
-        self._iid_to_path: Dict[str, str] = {}
+        # Single source of truth for row data: tree iid -> ItemSize. The
+        # label map is a secondary index for pie-hover lookups, keyed by
+        # (parent_iid, label) since names repeat across folders.
+        self._iid_to_item: Dict[str, ItemSize] = {}
+        self._label_to_iid: Dict[tuple, str] = {}
         self._loaded_iids = set()
-        self._pie_stack = []  # Stack to track pie chart states when drilling down
+        self._pie_stack = []  # Stack of (items, parent_iid) pie states when drilling down
         self._current_pie_items = []
-        self._pie_stack = []  # Stack to track pie chart states when drilling down
-        self._current_pie_items = []
-        
+        self._pie_parent_iid = ""  # tree level the pie currently shows
+        self._pending_pie = None  # after_idle handle for a coalesced redraw
+        self._stream_items: List[ItemSize] = []  # rows streamed in mid-scan
+        self._last_stream_draw = 0.0
+
         # --- FONT SETUP ---
         self.default_font_name = "Segoe UI"
         self.font_size_var = tk.IntVar(value=11) # Default bigger size
@@ -182,6 +366,11 @@ class App(tk.Tk):
         
         self.apply_filter_subfolders = tk.BooleanVar(value=True)
         ttk.Checkbutton(controls, text="Include subfolders", variable=self.apply_filter_subfolders).pack(side=tk.LEFT, padx=10)
+
+        # Serve sizes from the kernel attribute cache where supported (Linux
+        # statx); avoids forcing revalidation on network filesystems.
+        self.fast_sizes_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(controls, text="Fast (cached sizes)", variable=self.fast_sizes_var).pack(side=tk.LEFT, padx=10)
         
         self.status_var = tk.StringVar(value="Select a folder to begin.")
         ttk.Label(self, textvariable=self.status_var, anchor="w").pack(fill=tk.X, padx=10, pady=5)
@@ -233,16 +422,12 @@ class App(tk.Tk):
         right.rowconfigure(0, weight=1)
         right.columnconfigure(0, weight=1)
 
-        self.figure = Figure(figsize=(5, 4), dpi=self._system_dpi, frameon=False, facecolor='none')
-        self.ax = self.figure.add_subplot(111, frame_on=False, facecolor='none')
-        self.canvas = FigureCanvasTkAgg(self.figure, master=right)
-        self.ax.set_axis_off()
-        try:
-            self.ax.patch.set_visible(False)
-            self.figure.patch.set_visible(False)
-            self.canvas.get_tk_widget().configure(bd=0, highlightthickness=0)
-        except: pass
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # Figure/canvas are built lazily on the first pie draw so matplotlib's
+        # import cost stays off the startup path.
+        self.figure = None
+        self.ax = None
+        self.canvas = None
+        self._chart_parent = right
 
         self.after(200, lambda: self._paned.sashpos(0, 450) if self._paned.winfo_ismapped() else None)
 
@@ -267,7 +452,21 @@ class App(tk.Tk):
 
         # 3. Redraw pie chart if it exists (to update Matplotlib text size)
         if self._root_items:
-            self._draw_pie(self._root_items)
+            self._schedule_pie_redraw()
+
+    def _schedule_pie_redraw(self, items=None):
+        """Coalesce bursts of redraw triggers (e.g. spinbox clicks) into a
+        single idle-time draw."""
+        if items is not None:
+            self._current_pie_items = items
+        if self._pending_pie is not None:
+            try: self.after_cancel(self._pending_pie)
+            except: pass
+        self._pending_pie = self.after_idle(self._run_pie_redraw)
+
+    def _run_pie_redraw(self):
+        self._pending_pie = None
+        self._draw_pie(self._current_pie_items or self._root_items)
 
     def browse_folder(self):
         f = filedialog.askdirectory()
@@ -284,20 +483,42 @@ class App(tk.Tk):
 
     def start_root_scan(self):
         folder = self.folder_var.get().strip()
-        if not folder or not os.path.isdir(folder):
+        # One stat call validates existence and type together.
+        try:
+            st = os.stat(folder) if folder else None
+        except OSError:
+            st = None
+        if st is None or not stat_module.S_ISDIR(st.st_mode):
             messagebox.showerror("Error", "Invalid folder.")
             return
         
         self.tree.delete(*self.tree.get_children())
-        self._iid_to_path.clear()
+        self._iid_to_item.clear()
+        self._label_to_iid.clear()
         self._loaded_iids.clear()
-        self.ax.clear()
-        self.canvas.draw()
-        
+        if self.canvas is not None:
+            self.ax.clear()
+            # Drop the old scan's wedge artists and blit background, or the
+            # draw-event hook would repaint them over the cleared axes.
+            self._pie_wedges = []
+            self._pie_bg = None
+            self.canvas.draw()
+        # The draw-key skip must not match across scans: a cached rescan of
+        # the same folder would otherwise early-return against wedges that
+        # were just cleared. The SoA cache is keyed by list identity, so
+        # drop its reference too.
+        self._last_pie_key = None
+        self._pie_items_ref = None
+        self._pie_stack = []
+        self._current_pie_items = []
+        self._pie_parent_iid = ""
+
         self.status_var.set("Scanning root level...")
         self.prog_frame.pack(fill=tk.X, padx=10, before=self._paned)
         self.progress.start(10)
         self._cancel_flag = False
+        self._stream_items = []
+        self._last_stream_draw = 0.0
         
         self.scan_thread = threading.Thread(target=self._scan_thread_func, 
                                             args=(folder, "", True), daemon=True)
@@ -324,7 +545,7 @@ class App(tk.Tk):
             # Need to load children first
             if iid not in self._loaded_iids:
                 self.tree.delete(children[0])
-                path = self._iid_to_path.get(iid)
+                path = self._iid_path(iid)
                 if path:
                     self.status_var.set(f"Expanding: {os.path.basename(path)}...")
                     t = threading.Thread(target=self._scan_thread_func, 
@@ -342,12 +563,14 @@ class App(tk.Tk):
             self._pie_stack.pop()
             if self._pie_stack:
                 # Restore the previous level
-                previous_items = self._pie_stack[-1]
+                previous_items, parent = self._pie_stack[-1]
                 self._current_pie_items = previous_items
+                self._pie_parent_iid = parent
                 self._draw_pie(previous_items)
             else:
                 # Back to root level
                 self._current_pie_items = self._root_items
+                self._pie_parent_iid = ""
                 self._draw_pie(self._root_items)
 
     def _redraw_pie_for_folder(self, iid):
@@ -357,90 +580,110 @@ class App(tk.Tk):
         if not children:
             return
         
-        # Build ItemSize list from children
-        folder_items = []
-        for child_iid in children:
-            name = self.tree.item(child_iid, "text")
-            values = self.tree.item(child_iid, "values")
-            if values:
-                type_str = values[0]
-                size_str = values[1]
-                path = self._iid_to_path.get(child_iid, "")
-                
-                # Parse size back from human readable format
-                try:
-                    size = self._parse_human_size(size_str)
-                    is_dir = (type_str == "Folder")
-                    folder_items.append(ItemSize(label=name, path=path, size=size, is_dir=is_dir))
-                except:
-                    pass
-        
+        # The stored ItemSize rows are authoritative; no Tk round-trips.
+        folder_items = [self._iid_to_item[c] for c in children if c in self._iid_to_item]
+
         if folder_items:
             # Save current state before drilling down
             current = self._current_pie_items if self._current_pie_items else self._root_items
-            self._pie_stack.append(current)
+            self._pie_stack.append((current, self._pie_parent_iid))
             self._current_pie_items = folder_items
+            self._pie_parent_iid = iid
             self._draw_pie(folder_items)
 
-    def _parse_human_size(self, size_str: str) -> int:
-        """Parse human-readable size back to bytes"""
-        try:
-            parts = size_str.split()
-            if len(parts) == 2:
-                num = float(parts[0])
-                unit = parts[1]
-                multipliers = {"B": 1, "KB": 1024, "KiB": 1024, "MB": 1024**2, "MiB": 1024**2, 
-                              "GB": 1024**3, "GiB": 1024**3, "TB": 1024**4, "TiB": 1024**4}
-                return int(num * multipliers.get(unit, 1))
-        except:
-            pass
-        return 0
-
     def _scan_thread_func(self, folder, parent_iid, is_root):
         try:
             min_size = self.parse_min_size()
+
+            # Throttle progress at the producer: worker threads report once
+            # per directory, which on big trees still floods the queue faster
+            # than the 100 ms poller drains it.
+            last_emit = [0.0]
             def _prog(p):
-                if is_root: self.scan_queue.put(("progress", p))
+                if not is_root:
+                    return
+                now = time.monotonic()
+                if now - last_emit[0] < 0.1:
+                    return
+                last_emit[0] = now
+                self.scan_queue.put(("progress", p))
+
             def _canc():
                 return self._cancel_flag
 
-            items = list_items_parallel(folder, progress_cb=_prog, cancel_cb=_canc)
+            # With "Include subfolders" on, files below the threshold are
+            # pruned during the walk itself, so folder totals reflect only
+            # the files that pass the filter (and skip needless accounting).
+            inner_min = min_size if self.apply_filter_subfolders.get() else 0
+
+            # Stream each completed root item to the GUI so the table and
+            # pie start filling in immediately on slow trees.
+            def _on_item(it):
+                if is_root and it.size >= min_size:
+                    self.scan_queue.put(("partial", it))
+
+            items = list_items_parallel(folder, progress_cb=_prog, cancel_cb=_canc,
+                                        fast_sizes=self.fast_sizes_var.get(),
+                                        min_size=inner_min, on_item=_on_item)
             items = [it for it in items if it.size >= min_size]
             items.sort(key=lambda x: x.size, reverse=True)
-            self.scan_queue.put(("done", (parent_iid, items, is_root)))
+            # Total computed here so the GUI thread never re-sums the list.
+            grand_total = sum(it.size for it in items)
+            self.scan_queue.put(("done", (parent_iid, items, is_root, grand_total)))
         except Exception as e:
             self.scan_queue.put(("error", str(e)))
 
     def _poll_queue(self):
+        last_progress = None
         try:
             while True:
                 msg = self.scan_queue.get_nowait()
                 kind, payload = msg
-                
+
                 if kind == "error":
                     self.status_var.set(f"Error: {payload}")
                     self._stop_prog()
                     return
                 elif kind == "progress":
-                    short = (payload[-40:]) if len(payload)>40 else payload
-                    self.status_var.set(f"Scanning: ...{short}")
+                    # Coalesce any backlog; only the newest path matters.
+                    last_progress = payload
+                elif kind == "partial":
+                    it = payload
+                    self._populate_tree("", [it])
+                    self._stream_items.append(it)
+                    now = time.monotonic()
+                    if now - self._last_stream_draw > 0.2:
+                        self._last_stream_draw = now
+                        self._schedule_pie_redraw(list(self._stream_items))
                 elif kind == "done":
-                    parent_iid, items, is_root = payload
-                    self._populate_tree(parent_iid, items)
-                    
+                    parent_iid, items, is_root, grand_total = payload
+
                     if is_root:
+                        if self._stream_items:
+                            # Rows arrived via "partial" messages; just put
+                            # them in size order.
+                            self.sort_tree_col("size")
+                        else:
+                            self._populate_tree(parent_iid, items)
                         self._root_items = items
-                        self._current_pie_items = items
-                        self._draw_pie(items)
-                        self.status_var.set(f"Done. Found {len(items)} items.")
+                        self._schedule_pie_redraw(items)
+                        self.status_var.set(
+                            f"Done. Found {len(items)} items, {human_size(grand_total)} total.")
                         self._stop_prog()
                     else:
+                        self._populate_tree(parent_iid, items)
                         self._loaded_iids.add(parent_iid)
                         # After loading folder children, redraw pie for that folder
                         self._redraw_pie_for_folder(parent_iid)
                         self.status_var.set("Ready.")
+                    # Don't let a stale progress message overwrite the
+                    # completion status below.
+                    last_progress = None
         except queue.Empty:
             pass
+        if last_progress is not None:
+            short = (last_progress[-40:]) if len(last_progress) > 40 else last_progress
+            self.status_var.set(f"Scanning: ...{short}")
         self.after(100, self._poll_queue)
 
     def _stop_prog(self):
@@ -448,44 +691,96 @@ class App(tk.Tk):
         self.prog_frame.pack_forget()
 
     def _populate_tree(self, parent_iid, items: List[ItemSize]):
-        for it in items:
-            oid = self.tree.insert(parent_iid, tk.END, text=it.label, 
-                                   values=("Folder" if it.is_dir else "File", human_size(it.size)),
-                                   open=False)
-            self._iid_to_path[oid] = it.path
-            if it.is_dir:
-                self.tree.insert(oid, tk.END, text="dummy")
+        # Precompute row values, then bulk-insert with the widget unmapped so
+        # Tk doesn't relayout/redraw once per inserted row on big listings.
+        sizes_h = human_size_array([it.size for it in items])
+        rows = [(it, ("Folder" if it.is_dir else "File", h)) for it, h in zip(items, sizes_h)]
+        remap = len(rows) > 200 and self.tree.winfo_ismapped()
+        if remap:
+            self.tree.pack_forget()
+        try:
+            insert = self.tree.insert
+            for n, (it, values) in enumerate(rows):
+                oid = insert(parent_iid, tk.END, text=it.label, values=values, open=False)
+                self._iid_to_item[oid] = it
+                self._label_to_iid[(parent_iid, it.label)] = oid
+                if it.is_dir:
+                    insert(oid, tk.END, text="dummy")
+                # Let the event loop breathe on very large listings so the
+                # window keeps repainting instead of appearing frozen.
+                if n % 1000 == 999:
+                    self.update_idletasks()
+        finally:
+            if remap:
+                self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
     def cancel_scan(self):
         self._cancel_flag = True
 
-    def _draw_pie(self, items):
-        self.ax.clear()
-        try: self.ax.set_position([0,0,1,1])
+    def _ensure_canvas(self):
+        """Create the matplotlib figure and Tk canvas on first use."""
+        if self.canvas is not None:
+            return
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        self.figure = Figure(figsize=(5, 4), dpi=self._system_dpi, frameon=False, facecolor='none')
+        self.ax = self.figure.add_subplot(111, frame_on=False, facecolor='none')
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self._chart_parent)
+        self.ax.set_axis_off()
+        try:
+            self.ax.patch.set_visible(False)
+            self.figure.patch.set_visible(False)
+            self.canvas.get_tk_widget().configure(bd=0, highlightthickness=0)
         except: pass
-        
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    def _draw_pie(self, items):
+        self._ensure_canvas()
         if not items:
+            self.ax.clear()
+            self._last_pie_key = None
+            # Same stale-artist hazard as the clear in start_root_scan.
+            self._pie_wedges = []
+            self._pie_bg = None
             self.canvas.draw()
             return
-            
-        sizes = [max(0.1, i.size) for i in items]
-        labels = [i.label for i in items]
-        
-        if len(sizes) > 12:
-            pairs = sorted(zip(labels, sizes), key=lambda x:x[1], reverse=True)
-            head = pairs[:11]
-            tail = pairs[11:]
-            other_sz = sum(s for l,s in tail)
-            labels = [l for l,s in head] + ["Other"]
-            sizes = [s for l,s in head] + [other_sz]
 
-        try:
-            import matplotlib.cm as cm
-            import numpy as np
-            hashes = np.array([abs(hash(l))%256 for l in labels], dtype=float)
-            colors = cm.tab20((hashes%20)/20.0)
-        except: colors=None
-        
+        # SoA cache: font-size and hover-driven redraws pass the same item
+        # list, so reuse the arrays instead of rebuilding them per draw.
+        if getattr(self, '_pie_items_ref', None) is items:
+            sizes_np, labels = self._pie_sizes_np, self._pie_labels
+        else:
+            sizes_np = np.fromiter((i.size for i in items), dtype=np.float64, count=len(items))
+            labels = [i.label for i in items]
+            self._pie_items_ref = items
+            self._pie_sizes_np = sizes_np
+            self._pie_labels = labels
+
+        if len(items) > 12:
+            # O(n) top-k selection instead of sorting the whole list just to
+            # keep 11 wedges; only the head itself gets sorted.
+            idx = np.argpartition(-sizes_np, 11)[:11]
+            idx = idx[np.argsort(-sizes_np[idx])]
+            other_sz = float(sizes_np.sum() - sizes_np[idx].sum())
+            labels = [labels[i] for i in idx] + ["Other"]
+            sizes_np = np.append(sizes_np[idx], other_sz)
+        sizes = np.maximum(sizes_np, 0.1)
+
+        # Rebuilding wedge artists is the expensive part of a draw; skip it
+        # when the wedges on screen would come out identical (e.g. font-size
+        # redraws, drill-up restores of the same level).
+        key = (tuple(labels), tuple(sizes.tolist()))
+        if key == getattr(self, '_last_pie_key', None):
+            return
+        self._last_pie_key = key
+
+        self.ax.clear()
+        try: self.ax.set_position([0,0,1,1])
+        except: pass
+
+        idx20 = np.fromiter((hash(l) % 20 for l in labels), dtype=np.int64, count=len(labels))
+        colors = _tab20_table()[idx20]
+
         # Pass font size to matplotlib textprops
         curr_fs = 11
         try: curr_fs = self.font_size_var.get()
@@ -500,7 +795,21 @@ class App(tk.Tk):
         
         self._wedge_map = dict(zip(wedges, labels))
         self._lbl_to_wedge = dict(zip(labels, wedges))
-        
+        self._hover_wedge = None
+        # Cumulative wedge angles for O(log n) hover hit-testing (wedges run
+        # counterclockwise from the 90-degree start angle).
+        self._wedge_cum = np.cumsum(sizes) / float(sizes.sum()) * 360.0
+        self._pie_radius = 0.98
+
+        # Blitting setup: wedges are animated artists drawn over a cached
+        # background, so hover highlights repaint just the wedges instead of
+        # rerendering the whole figure on every mouse move.
+        self._pie_wedges = list(wedges)
+        for w in wedges:
+            w.set_animated(True)
+        if not hasattr(self, '_pie_draw_cid'):
+            self._pie_draw_cid = self.canvas.mpl_connect('draw_event', self._on_pie_draw)
+
         # Add hover handler for pie chart
         if hasattr(self, '_pie_hover_cid'):
             self.canvas.mpl_disconnect(self._pie_hover_cid)
@@ -508,63 +817,102 @@ class App(tk.Tk):
         
         self.canvas.draw()
 
+    def _on_pie_draw(self, event):
+        """Recapture the blit background whenever a full draw happens
+        (initial draw, resize, theme change) and repaint the wedges."""
+        self._pie_bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        for w in getattr(self, '_pie_wedges', ()):
+            self.ax.draw_artist(w)
+
+    def _blit_wedges(self):
+        bg = getattr(self, '_pie_bg', None)
+        if bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(bg)
+        for w in self._pie_wedges:
+            self.ax.draw_artist(w)
+        self.canvas.blit(self.ax.bbox)
+
     def _on_pie_hover(self, event):
         """Highlight tree row when hovering over pie wedge"""
-        if not hasattr(self, '_wedge_map') or event.inaxes != self.ax:
+        if not hasattr(self, '_wedge_cum') or event.inaxes != self.ax:
             return
-        
-        # Find which wedge is under the mouse
+
+        # Radius check plus a binary search on cumulative angles replaces the
+        # per-wedge contains_point rasterization.
         hovered_label = None
-        for wedge, label in self._wedge_map.items():
-            if wedge.contains_point([event.x, event.y]):
-                hovered_label = label
-                break
-        
+        x, y = event.xdata, event.ydata
+        if x is not None and y is not None and x * x + y * y <= self._pie_radius ** 2:
+            theta = (math.degrees(math.atan2(y, x)) - 90.0) % 360.0
+            idx = int(np.searchsorted(self._wedge_cum, theta, side='right'))
+            if idx < len(self._pie_wedges):
+                hovered_label = self._wedge_map.get(self._pie_wedges[idx])
+
+        # Only touch the Treeview on wedge transitions; motion within the
+        # same wedge (the common case) costs nothing.
+        if hovered_label == getattr(self, '_hover_label', None):
+            return
+        self._hover_label = hovered_label
+
         # Highlight the corresponding tree row
         if hovered_label:
-            # Find the tree item with this label
-            for iid in self.tree.get_children():
-                if self.tree.item(iid, "text") == hovered_label:
-                    self.tree.selection_set(iid)
-                    self.tree.see(iid)
-                    break
+            # Single dict lookup instead of one Tcl round-trip per row;
+            # scoped to the level the pie is showing so a nested file that
+            # shares a root item's name can't hijack the highlight.
+            iid = self._label_to_iid.get((self._pie_parent_iid, hovered_label))
+            if iid:
+                self.tree.selection_set(iid)
+                self.tree.see(iid)
         else:
             # Clear selection when not hovering over any wedge
             self.tree.selection_remove(self.tree.selection())
 
     def _on_tree_hover(self, event):
+        if not hasattr(self, '_lbl_to_wedge'):
+            return
         iid = self.tree.identify_row(event.y)
-        if hasattr(self, '_lbl_to_wedge'):
-            for w in self._lbl_to_wedge.values(): w.set_alpha(1.0)
-            if iid:
-                # Get the item text (could be nested in a folder)
-                txt = self.tree.item(iid, "text")
-                
-                # First try direct match
-                w = self._lbl_to_wedge.get(txt)
-                
-                # If no direct match, check if this item is under a root folder
-                if not w:
-                    # Walk up the tree to find the root parent
-                    parent = self.tree.parent(iid)
-                    while parent:
-                        next_parent = self.tree.parent(parent)
-                        if not next_parent:  # This is a root item
-                            parent_txt = self.tree.item(parent, "text")
-                            w = self._lbl_to_wedge.get(parent_txt)
-                            break
-                        parent = next_parent
-                
-                if w: w.set_alpha(0.6)
-            self.canvas.draw_idle()
+        w = None
+        if iid:
+            # Get the item text (could be nested in a folder)
+            txt = self.tree.item(iid, "text")
+
+            # First try direct match
+            w = self._lbl_to_wedge.get(txt)
+
+            # If no direct match, check if this item is under a root folder
+            if not w:
+                # Walk up the tree to find the root parent
+                parent = self.tree.parent(iid)
+                while parent:
+                    next_parent = self.tree.parent(parent)
+                    if not next_parent:  # This is a root item
+                        parent_txt = self.tree.item(parent, "text")
+                        w = self._lbl_to_wedge.get(parent_txt)
+                        break
+                    parent = next_parent
+
+        # Touch only the wedge that changed and blit; no full redraw.
+        prev = getattr(self, '_hover_wedge', None)
+        if w is prev:
+            return
+        if prev is not None:
+            prev.set_alpha(1.0)
+        if w is not None:
+            w.set_alpha(0.6)
+        self._hover_wedge = w
+        self._blit_wedges()
+
+    def _iid_path(self, iid) -> Optional[str]:
+        it = self._iid_to_item.get(iid)
+        return it.path if it else None
 
     def _on_double_click(self, event):
         sel = self.tree.selection()
         if not sel: return
-        path = self._iid_to_path.get(sel[0])
+        path = self._iid_path(sel[0])
         if path:
             try:
-                import subprocess
                 subprocess.run(['explorer', '/select,', os.path.normpath(path)])
             except: pass
 
@@ -585,7 +933,7 @@ class App(tk.Tk):
     def _ctx_open(self):
         sel = self.tree.selection()
         if sel:
-            path = self._iid_to_path.get(sel[0])
+            path = self._iid_path(sel[0])
             if path:
                 try: os.startfile(path)
                 except: pass
@@ -593,17 +941,16 @@ class App(tk.Tk):
     def _ctx_open_explorer(self):
         sel = self.tree.selection()
         if sel:
-            path = self._iid_to_path.get(sel[0])
+            path = self._iid_path(sel[0])
             if path:
                 try:
-                    import subprocess
                     subprocess.run(['explorer', '/select,', os.path.normpath(path)])
                 except: pass
 
     def _ctx_copy(self):
         sel = self.tree.selection()
         if sel:
-            path = self._iid_to_path.get(sel[0])
+            path = self._iid_path(sel[0])
             if path:
                 self.clipboard_clear()
                 self.clipboard_append(path)
@@ -611,27 +958,52 @@ class App(tk.Tk):
     def export_csv(self):
         if not self._root_items: return
         fp = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV","*.csv")])
-        if fp:
-            import csv
-            with open(fp, 'w', newline='', encoding='utf-8') as f:
-                w = csv.writer(f)
-                w.writerow(["Name", "Path", "Type", "Size"])
-                for i in self._root_items:
-                    w.writerow([i.label, i.path, "Folder" if i.is_dir else "File", i.size])
+        if not fp:
+            return
+        items = self._root_items
+        self.status_var.set("Exporting...")
+
+        # Write off the main loop so a big listing doesn't freeze the UI;
+        # completion is reported back through a queue like the scan worker.
+        def _work():
+            try:
+                humans = human_size_array([i.size for i in items])
+                # One buffered writerows call; csv's C layer does the batching.
+                with open(fp, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                    w = csv.writer(f)
+                    w.writerow(["Name", "Path", "Type", "SizeBytes", "SizeHuman"])
+                    w.writerows((i.label, i.path, "Folder" if i.is_dir else "File", i.size, h)
+                                for i, h in zip(items, humans))
+                self._export_queue.put(("ok", fp))
+            except OSError as e:
+                self._export_queue.put(("error", str(e)))
+
+        threading.Thread(target=_work, daemon=True).start()
+        self.after(100, self._poll_export)
+
+    def _poll_export(self):
+        try:
+            kind, payload = self._export_queue.get_nowait()
+        except queue.Empty:
+            self.after(100, self._poll_export)
+            return
+        self.status_var.set("Ready.")
+        if kind == "ok":
             messagebox.showinfo("Export", "Done")
+        else:
+            messagebox.showerror("Export", f"Export failed: {payload}")
 
     def sort_tree_col(self, col):
-        l = [(self.tree.set(k, "size") if col=="size" else self.tree.item(k, "text"), k) 
-             for k in self.tree.get_children('')]
+        key0 = operator.itemgetter(0)
         if col == "size":
-            def parse(s):
-                try:
-                    num, unit = s.split()
-                    return float(num) * {"B":1, "KB":1024, "MB":1024**2, "GB":1024**3}.get(unit,1)
-                except: return 0
-            l.sort(key=lambda x: parse(x[0]), reverse=True)
+            # Sort on the stored byte counts; no string parsing.
+            items = self._iid_to_item
+            l = [(items[k].size if k in items else 0, k) for k in self.tree.get_children('')]
+            l.sort(key=key0, reverse=True)
         else:
-            l.sort(reverse=False)
+            # Case-insensitive so "Zebra" doesn't sort ahead of "apple".
+            l = [(self.tree.item(k, "text").lower(), k) for k in self.tree.get_children('')]
+            l.sort(key=key0)
         for idx, (_, k) in enumerate(l):
             self.tree.move(k, '', idx)
 